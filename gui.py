@@ -8,6 +8,7 @@ import pandas as pd
 import numpy as np
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # Import harness analyzer
 from harness_analyzer import HarnessAnalyzer
@@ -20,7 +21,11 @@ class WireHarnessApp:
         
         # Initialize analyzer
         self.analyzer = HarnessAnalyzer()
+        
+        # Path analysis runs on a worker thread so the Tk main loop stays responsive
+        self.executor = ThreadPoolExecutor(max_workers=1)
         self.setup_gui()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
     
     def setup_gui(self):
         """Set up the GUI components"""  
@@ -33,8 +38,9 @@ class WireHarnessApp:
         left_panel.pack(side=tk.LEFT, fill=tk.Y, padx=5, pady=5)
         
         # Load sample data button
-        ttk.Button(left_panel, text="Load Sample Data", 
-                   command=self.load_sample_data).pack(fill=tk.X, pady=5)
+        self.load_button = ttk.Button(left_panel, text="Load Sample Data", 
+                                      command=self.load_sample_data)
+        self.load_button.pack(fill=tk.X, pady=5)
         
         # Analysis section
         analysis_frame = ttk.LabelFrame(left_panel, text="Analysis", padding="10")
@@ -63,8 +69,9 @@ class WireHarnessApp:
         self.target_combo = ttk.Combobox(path_frame, textvariable=self.target_var)
         self.target_combo.pack(fill=tk.X, pady=5)
         
-        ttk.Button(path_frame, text="Find Optimal Path", 
-                   command=self.find_optimal_path).pack(fill=tk.X, pady=5)
+        self.path_button = ttk.Button(path_frame, text="Find Optimal Path", 
+                                      command=self.find_optimal_path)
+        self.path_button.pack(fill=tk.X, pady=5)
         
         # Create right panel for visualization
         right_panel = ttk.LabelFrame(main_frame, text="Visualization", padding="10")
@@ -75,6 +82,13 @@ class WireHarnessApp:
         self.canvas = FigureCanvasTkAgg(self.fig, master=right_panel)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
+        # Static background for blitting, the animated path highlight and the
+        # artists that sit above it
+        self.background = None
+        self.path_artist = None
+        self.overlay_artists = []
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        
         # Create status bar
         self.status_var = tk.StringVar()
         self.status_var.set("Ready")
@@ -85,7 +99,9 @@ class WireHarnessApp:
         self.results_frame = ttk.LabelFrame(main_frame, text="Results", padding="10")
         self.results_frame.pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=5)
         
-        self.results_text = tk.Text(self.results_frame, height=10, width=50)
+        # Read-only output with no undo history, so bulk replacements stay cheap
+        self.results_text = tk.Text(self.results_frame, height=10, width=50, 
+                                    undo=False, autoseparators=False, state='disabled')
         self.results_text.pack(fill=tk.BOTH, expand=True)
     
     def load_sample_data(self):
@@ -105,13 +121,23 @@ class WireHarnessApp:
         # Visualize
         self.ax.clear()
         self.analyzer.visualize_harness(ax=self.ax)
-        self.canvas.draw()
+        
+        # Path highlight is animated so it is only ever drawn via blitting. The nodes
+        # and labels stacked above it are animated too, so they stay on top of the path
+        self.path_artist = self.analyzer.highlight_artist
+        self.overlay_artists = [artist for artist in (*self.ax.collections, *self.ax.texts) 
+                                if artist.get_zorder() > self.path_artist.get_zorder()]
+        for artist in (self.path_artist, *self.overlay_artists):
+            artist.set_animated(True)
+        self.background = None
+        self.canvas.draw_idle()
         
         # Show basic info
-        self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, "Wire Harness Graph Loaded\n")
-        self.results_text.insert(tk.END, f"Number of nodes: {self.analyzer.harness_graph.number_of_nodes()}\n")
-        self.results_text.insert(tk.END, f"Number of edges: {self.analyzer.harness_graph.number_of_edges()}\n")
+        self._set_results(
+            "Wire Harness Graph Loaded\n"
+            f"Number of nodes: {self.analyzer.harness_graph.number_of_nodes()}\n"
+            f"Number of edges: {self.analyzer.harness_graph.number_of_edges()}\n"
+        )
     
     def show_total_length(self):
         """Calculate and display total wire length"""
@@ -120,8 +146,7 @@ class WireHarnessApp:
             return
         
         total_length = self.analyzer.calculate_total_length()
-        self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, f"Total Wire Length: {total_length:.2f} meters\n")
+        self._set_results(f"Total Wire Length: {total_length:.2f} meters\n")
         self.status_var.set(f"Total length calculated: {total_length:.2f} m")
     
     def show_bundle_diameters(self):
@@ -132,17 +157,16 @@ class WireHarnessApp:
         
         bundle_diameters = self.analyzer.estimate_bundle_diameter()
         
-        self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, "Bundle Diameters (mm):\n")
-        
-        for (u, v), diameter in bundle_diameters.items():
-            self.results_text.insert(tk.END, f"{u} to {v}: {diameter:.2f} mm\n")
+        # One buffer for both reductions
+        values = np.fromiter(bundle_diameters.values(), dtype=np.float64, count=len(bundle_diameters))
+        avg_diameter = values.mean()
+        max_diameter = values.max()
         
-        avg_diameter = np.mean(list(bundle_diameters.values()))
-        max_diameter = max(bundle_diameters.values())
-        
-        self.results_text.insert(tk.END, f"\nAverage Diameter: {avg_diameter:.2f} mm\n")
-        self.results_text.insert(tk.END, f"Maximum Diameter: {max_diameter:.2f} mm\n")
+        lines = ["Bundle Diameters (mm):"]
+        lines.extend(f"{u} to {v}: {diameter:.2f} mm" for (u, v), diameter in bundle_diameters.items())
+        lines.append(f"\nAverage Diameter: {avg_diameter:.2f} mm")
+        lines.append(f"Maximum Diameter: {max_diameter:.2f} mm")
+        self._set_results("\n".join(lines) + "\n")
         
         self.status_var.set(f"Bundle diameters calculated")
     
@@ -159,33 +183,95 @@ class WireHarnessApp:
             messagebox.showinfo("Error", "Please select source and target nodes")
             return
         
+        self.status_var.set(f"Finding optimal path from {source} to {target}...")
+        future = self.executor.submit(self._analyze_path, source, target)
+        
+        # The worker shares the analyzer, so nothing may reload the graph until it finishes
+        self._set_path_busy(True)
+        self.root.after(50, self._check_path_result, future, source, target)
+    
+    def _analyze_path(self, source, target):
+        """Find the optimal path and its bundle diameter and complexity (worker thread)"""
         path, length = self.analyzer.find_optimal_path(source, target)
+        if path is None:
+            return None, length, None, None
+        
+        # Calculate bundle diameter once and reuse it for the installation complexity
+        diameter = self.analyzer.estimate_bundle_diameter(path)
+        complexity = self.analyzer.estimate_installation_complexity(path, bundle_diameter=diameter)
+        return path, length, diameter, complexity
+    
+    def _check_path_result(self, future, source, target):
+        """Poll the path analysis and show its results once finished"""
+        if not future.done():
+            self.root.after(50, self._check_path_result, future, source, target)
+            return
+        
+        self._set_path_busy(False)
+        path, length, diameter, complexity = future.result()
         
         if path is None:
             messagebox.showinfo("No Path", f"No path found between {source} and {target}")
             return
         
         # Display results
-        self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, f"Optimal path from {source} to {target}:\n")
-        self.results_text.insert(tk.END, " -> ".join(path) + "\n")
-        self.results_text.insert(tk.END, f"Total path length: {length:.2f} meters\n")
-        
-        # Calculate installation complexity for this path
-        complexity = self.analyzer.estimate_installation_complexity(path)
-        self.results_text.insert(tk.END, f"Installation complexity: {complexity:.1f}/10\n")
-        
-        # Calculate bundle diameter for this path
-        diameter = self.analyzer.estimate_bundle_diameter(path)
-        self.results_text.insert(tk.END, f"Bundle diameter: {diameter:.2f} mm\n")
-        
-        # Visualize
-        self.ax.clear()
+        lines = [
+            f"Optimal path from {source} to {target}:",
+            " -> ".join(path),
+            f"Total path length: {length:.2f} meters",
+            f"Installation complexity: {complexity:.1f}/10",
+            f"Bundle diameter: {diameter:.2f} mm",
+        ]
+        self._set_results("\n".join(lines) + "\n")
+        
+        # Visualize; the harness artists are reused so only the highlight changes
         self.analyzer.visualize_harness(ax=self.ax, highlight_path=path)
-        self.canvas.draw()
+        self._blit_path()
         
         self.status_var.set(f"Optimal path found: {length:.2f} m")
     
+    def _set_path_busy(self, busy):
+        """Disable the buttons that load or query the graph while a path analysis is pending"""
+        state = 'disabled' if busy else 'normal'
+        self.load_button.configure(state=state)
+        self.path_button.configure(state=state)
+    
+    def on_close(self):
+        """Drop any pending path analysis and close the window"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+    
+    def _set_results(self, text):
+        """Replace the contents of the read-only results panel in a single Tk call"""
+        self.results_text.configure(state='normal')
+        self.results_text.replace(1.0, tk.END, text)
+        self.results_text.configure(state='disabled')
+        self.results_text.mark_set('insert', 'end')
+        self.root.update_idletasks()
+    
+    def _on_draw(self, event):
+        """Cache the static background after a full draw and redraw the highlight layers on top"""
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+        if self.path_artist is not None:
+            self._draw_path()
+    
+    def _blit_path(self):
+        """Redraw only the path highlight over the cached background"""
+        if self.background is None:
+            # No full draw yet; the draw event will render the highlight
+            self.canvas.draw_idle()
+            return
+        
+        self.canvas.restore_region(self.background)
+        self._draw_path()
+        self.canvas.blit(self.ax.bbox)
+    
+    def _draw_path(self):
+        """Draw the path highlight, then the nodes and labels that belong above it"""
+        self.ax.draw_artist(self.path_artist)
+        for artist in self.overlay_artists:
+            self.ax.draw_artist(artist)
+    
     def show_report(self):
         """Generate and display comprehensive report"""
         if not hasattr(self.analyzer, 'harness_graph') or self.analyzer.harness_graph.number_of_nodes() == 0:
@@ -194,12 +280,9 @@ class WireHarnessApp:
         
         report = self.analyzer.generate_report()
         
-        self.results_text.delete(1.0, tk.END)
-        self.results_text.insert(tk.END, "Wire Harness Analysis Report\n")
-        self.results_text.insert(tk.END, "=" * 40 + "\n\n")
-        
-        for key, value in report.items():
-            self.results_text.insert(tk.END, f"{key}: {value}\n")
+        lines = ["Wire Harness Analysis Report", "=" * 40, ""]
+        lines.extend(f"{key}: {value}" for key, value in report.items())
+        self._set_results("\n".join(lines) + "\n")
         
         self.status_var.set("Report generated")
 
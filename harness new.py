@@ -1,7 +1,57 @@
+import math
+import numbers
+from collections import OrderedDict
+from enum import IntEnum
+
 import networkx as nx
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+
+from harness_kernels import bundle_diameter_csr, dijkstra_csr, gauge_index, report_totals, segment_diameters, wire_diameters
+
+
+class NodeType(IntEnum):
+    """Integer node type codes; 0 is left for unknown types"""
+    CONTROLLER = 1
+    SENSOR = 2
+    ACTUATOR = 3
+    JUNCTION = 4
+    SUB_JUNCTION = 5
+
+
+class WireType(IntEnum):
+    """Integer wire type codes; 0 is left for unknown types"""
+    POWER = 1
+    SIGNAL = 2
+
+
+# Graph type strings to codes, e.g. "sub_junction" -> NodeType.SUB_JUNCTION
+NODE_TYPE_INDEX = {node_type.name.lower(): node_type for node_type in NodeType}
+WIRE_TYPE_INDEX = {wire_type.name.lower(): wire_type for wire_type in WireType}
+
+# Drawing lookup tables indexed by type code; index 0 is the fallback for unknown types
+NODE_COLOR_LUT = np.array(['gray', 'red', 'green', 'blue', 'orange', 'yellow'])
+NODE_SIZE_LUT = np.array([400, 600, 500, 500, 450, 350])
+EDGE_COLOR_LUT = np.array(['black', 'red', 'blue'])
+
+# Node type codes that count as junctions
+JUNCTION_TYPES = [NodeType.JUNCTION, NodeType.SUB_JUNCTION]
+
+# Gauge label text per AWG number, shared by every edge with that gauge
+AWG_LABELS = tuple(f"{gauge}AWG" for gauge in range(32))
+
+
+def awg_label(gauge):
+    """Edge label text for a gauge, reusing the prebuilt string where there is one"""
+    if type(gauge) is int and 0 <= gauge < len(AWG_LABELS):
+        return AWG_LABELS[gauge]
+    return f"{gauge}AWG"
+
+
+# Bundle diameter results kept per graph version, least recently used evicted first
+DIAMETER_CACHE_SIZE = 64
 
 
 class HarnessAnalyzer:
@@ -9,11 +59,50 @@ class HarnessAnalyzer:
         self.harness_graph = nx.Graph()
         self.node_positions = {}
         
+        # Struct-of-arrays copy of the graph, rebuilt by _build_arrays
+        self.nodes = []
+        self.node_type = np.zeros(0, dtype=np.int8)
+        self._type_counts = np.zeros(len(NodeType) + 1, dtype=np.int64)
+        self.node_pos = np.zeros((0, 2), dtype=np.float64)
+        self.edge_src = np.zeros(0, dtype=np.int32)
+        self.edge_dst = np.zeros(0, dtype=np.int32)
+        self.edge_gauge = np.zeros(0, dtype=np.int8)
+        self.edge_awg = np.zeros(0, dtype=np.float64)
+        self.edge_nsig = np.zeros(0, dtype=np.int16)
+        self.edge_length = np.zeros(0, dtype=np.float64)
+        self.edge_wire_type = np.zeros(0, dtype=np.int8)
+        self.adj_indptr = np.zeros(1, dtype=np.int64)
+        self.adj_indices = np.zeros(0, dtype=np.int64)
+        self.adj_edge = np.zeros(0, dtype=np.int64)
+        self._node_index = {}
+        self._edge_keys = []
+        self._edge_gauge_labels = []
+        self._edge_index = {}
+        
+        # Bumped on every graph mutation to invalidate cached results
+        self._graph_version = 0
+        self._diameter_cache = OrderedDict()
+        self._aggregate_cache = {}
+        self._downstream_cache = {}
+        self._adj_weight_cache = {}
+        self._sssp_cache = {}
+        self._render_cache = {}
+        self._edge_label_cache = {}
+        
+        # Artists from the last visualize_harness call and the graph version they show
+        self._artists = None
+        self._artists_version = None
+        self.highlight_artist = None
+        self._legend = None
+        
     def load_sample_data(self, include_sub_junctions=True):
         """Load sample wire harness data with optional sub-junction structure
         
         Args:
             include_sub_junctions (bool): Whether to include sub-junction structures
+            
+        Returns:
+            nx.Graph: The harness graph; call refresh() after editing it directly
         """
         # Create nodes (connectors/components)
         nodes = [
@@ -57,21 +146,92 @@ class HarnessAnalyzer:
             edges.extend(sub_edges)
         
         # Create graph
-        self.harness_graph.add_nodes_from(nodes)
-        self.harness_graph.add_edges_from(edges)
+        self._fill_graph(nodes, edges)
+        self.refresh()
+        
+        return self.harness_graph
+    
+    def refresh(self):
+        """Rebuild the analysis state after harness_graph has been edited
         
+        Every analysis reads a NumPy copy of the graph, so direct edits to
+        harness_graph must be followed by a call to this method; until then,
+        results describe the graph as it was. add_node and add_edge call it
+        themselves.
+        """
         # Store node positions for visualization
-        self.node_positions = {node: data["position"] for node, data in self.harness_graph.nodes(data=True)}
+        self.node_positions = {node: data["position"] for node, data in self.harness_graph.nodes(data=True) 
+                               if "position" in data}
+        
+        # Drop results cached for the old graph and rebuild its array mirror
+        self._invalidate_cache()
+        self._build_arrays()
         
         # Add junction hierarchy information to graph
         self._compute_junction_hierarchy()
+    
+    def add_node(self, node, **attrs):
+        """Add a node to the harness, or update its attributes, and refresh the analysis state
         
-        return self.harness_graph
+        Args:
+            node (str): Node name
+            **attrs: Node attributes such as type and position
+        """
+        self.harness_graph.add_node(node, **attrs)
+        self.refresh()
+    
+    def add_edge(self, u, v, **attrs):
+        """Add a wire segment to the harness, or update its attributes, and refresh the analysis state
+        
+        Args:
+            u, v (str): End nodes, added if not already in the harness
+            **attrs: Segment attributes such as wire_type, gauge, length and signals
+        """
+        self.harness_graph.add_edge(u, v, **attrs)
+        self.refresh()
+    
+    def _fill_graph(self, nodes, edges):
+        """Add nodes and edges by writing the graph's node and adjacency dicts directly
+        
+        Same result as add_nodes_from/add_edges_from, including attribute merging
+        on reload and one shared data dict per undirected edge, without NetworkX's
+        per-item argument handling.
+        """
+        graph = self.harness_graph
+        node_data, adj = graph._node, graph._adj
+        for node, attrs in nodes:
+            node_data.setdefault(node, {}).update(attrs)
+            adj.setdefault(node, {})
+        
+        for u, v, attrs in edges:
+            for node in (u, v):
+                if node not in node_data:
+                    node_data[node] = {}
+                    adj[node] = {}
+            data = adj[u].get(v, {})
+            data.update(attrs)
+            adj[u][v] = data
+            adj[v][u] = data
+        
+        # Drop anything NetworkX cached for the old structure
+        getattr(graph, "__networkx_cache__", {}).clear()
+    
+    def _invalidate_cache(self):
+        """Mark the graph as changed so cached results are recomputed"""
+        self._graph_version += 1
+        self._diameter_cache.clear()
+        self._aggregate_cache.clear()
+        self._downstream_cache.clear()
+        self._adj_weight_cache.clear()
+        self._sssp_cache.clear()
+        self._render_cache.clear()
+        self._edge_label_cache.clear()
     
     def _compute_junction_hierarchy(self):
         """Compute the junction hierarchy to track which junctions feed into others"""
-        junction_nodes = [node for node, data in self.harness_graph.nodes(data=True) 
-                         if data.get("type") in ["junction", "sub_junction"]]
+        is_junction = np.isin(self.node_type, JUNCTION_TYPES)
+        node_to_idx = self._node_index
+        junction_nodes = [self.nodes[i] for i in np.flatnonzero(is_junction)]
         
         # For each junction, identify its downstream junctions
         for junction in junction_nodes:
@@ -79,16 +239,65 @@ class HarnessAnalyzer:
             neighbors = list(self.harness_graph.neighbors(junction))
             
             # Find sub-junctions among neighbors
-            sub_junctions = [n for n in neighbors if 
-                            self.harness_graph.nodes[n].get("type") in ["junction", "sub_junction"]]
+            sub_junctions = [n for n in neighbors if is_junction[node_to_idx[n]]]
             
             # Store this information in the junction node attributes
             self.harness_graph.nodes[junction]["downstream_junctions"] = sub_junctions
     
+    def _build_arrays(self):
+        """Copy node and edge attributes into flat NumPy arrays for vectorized passes"""
+        graph = self.harness_graph
+        self.nodes = list(graph.nodes())
+        self._node_index = node_to_idx = {node: i for i, node in enumerate(self.nodes)}
+        
+        self.node_type = np.array([NODE_TYPE_INDEX.get(data.get("type", ""), 0) 
+                                   for _, data in graph.nodes(data=True)], dtype=np.int8)
+        # Node counts per type code; rebuilt here on every refresh(), so add_node keeps them live
+        self._type_counts = np.bincount(self.node_type, minlength=len(NodeType) + 1)
+        # Nodes without a position can still be analyzed; they are NaN here and cannot be drawn
+        self.node_pos = np.array([self.node_positions.get(node, (np.nan, np.nan)) for node in self.nodes], 
+                                 dtype=np.float64).reshape(-1, 2)
+        
+        edges = list(graph.edges(data=True))
+        self._edge_keys = [(u, v) for u, v, _ in edges]
+        self._edge_gauge_labels = [awg_label(data.get("gauge", "")) for _, _, data in edges]
+        self._edge_index = {key: i for i, key in enumerate(self._edge_keys)}
+        self.edge_src = np.array([node_to_idx[u] for u, _, _ in edges], dtype=np.int32)
+        self.edge_dst = np.array([node_to_idx[v] for _, v, _ in edges], dtype=np.int32)
+        
+        # Default to 20 AWG and one signal per segment if not specified
+        # Gauges without a tabulated diameter fold onto the default slot, so the int8 column never overflows
+        self.edge_gauge = np.array([gauge_index(data.get("gauge", 20)) for _, _, data in edges], dtype=np.int8)
+        # edge_gauge holds lookup-table rows; line widths need the AWG number itself
+        gauges = (data.get("gauge", 20) for _, _, data in edges)
+        self.edge_awg = np.fromiter((gauge if isinstance(gauge, numbers.Real) else 20 for gauge in gauges), 
+                                    dtype=np.float64, count=len(edges))
+        self.edge_nsig = np.fromiter((len(data["signals"]) if "signals" in data else 1 for _, _, data in edges), 
+                                     dtype=np.int16, count=len(edges))
+        self.edge_length = np.array([data.get("length", 0.0) for _, _, data in edges], dtype=np.float64)
+        self.edge_wire_type = np.array([WIRE_TYPE_INDEX.get(data.get("wire_type", ""), 0) for _, _, data in edges], 
+                                       dtype=np.int8)
+        
+        # CSR adjacency in the graph's own neighbor order, with the edge row of each entry
+        self.adj_indptr = np.zeros(len(self.nodes) + 1, dtype=np.int64)
+        adj = graph._adj
+        indices = []
+        adj_edge = []
+        for i, node in enumerate(self.nodes):
+            for neighbor in adj[node]:
+                indices.append(node_to_idx[neighbor])
+                adj_edge.append(self._edge_index[self._edge_key(node, neighbor)])
+            self.adj_indptr[i + 1] = len(indices)
+        self.adj_indices = np.array(indices, dtype=np.int64)
+        self.adj_edge = np.array(adj_edge, dtype=np.int64)
+    
+    def _edge_key(self, u, v):
+        """Canonical (u, v) key of an undirected edge, matching the graph's own orientation"""
+        return (u, v) if (u, v) in self._edge_index else (v, u)
+    
     def calculate_total_length(self):
         """Calculate the total wire length in the harness"""
-        total_length = sum(data["length"] for _, _, data in self.harness_graph.edges(data=True))
-        return total_length
+        return float(self.edge_length.sum())
     
     def get_downstream_edges(self, node):
         """Get all edges in branches downstream from the given node
@@ -97,155 +306,109 @@ class HarnessAnalyzer:
             node (str): Starting node name
             
         Returns:
-            list: List of edge tuples (u, v) that are downstream from the node
+            list: List of edge tuples (u, v) that are downstream from the node, in
+                  depth-first order. The walk is cached until the graph is next
+                  modified; each call returns a new list.
         """
-        visited = set()
+        key = (self._graph_version, node)
+        if key in self._downstream_cache:
+            return list(self._downstream_cache[key])
+        
+        visited = {node}
         downstream_edges = []
         
-        def dfs(current_node, parent=None):
-            visited.add(current_node)
-            
-            for neighbor in self.harness_graph.neighbors(current_node):
-                if neighbor != parent:
-                    if neighbor not in visited:
-                        downstream_edges.append((current_node, neighbor))
-                        dfs(neighbor, current_node)
+        # Iterative depth-first search; each stack entry keeps its own neighbor
+        # iterator so edges come out in the same order as a recursive walk
+        stack = [(node, iter(self.harness_graph.neighbors(node)))]
+        while stack:
+            current_node, neighbors = stack[-1]
+            for neighbor in neighbors:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    downstream_edges.append((current_node, neighbor))
+                    stack.append((neighbor, iter(self.harness_graph.neighbors(neighbor))))
+                    break
+            else:
+                stack.pop()
         
-        dfs(node)
+        self._downstream_cache[key] = tuple(downstream_edges)
         return downstream_edges
     
     def estimate_bundle_diameter(self, path=None, consider_hierarchy=True):
         """Estimate wire bundle diameter based on wire gauges and branch hierarchy
         
+        The last DIAMETER_CACHE_SIZE results are cached until the graph is next
+        modified. Callers get their own copy, so they may modify it freely.
+        
         Args:
             path (list): Optional path of nodes to calculate diameter for a specific segment
                          If None, calculates for each segment
             consider_hierarchy (bool): Whether to consider junction hierarchy when calculating
                                       bundle diameters
         """
-        # Wire gauge to diameter mapping (AWG to mm)
-        gauge_to_diameter = {
-            16: 1.29,
-            18: 1.02,
-            20: 0.81,
-            22: 0.64,
-            24: 0.51
-        }
-        
+        key = (self._graph_version, tuple(path) if path else None, consider_hierarchy)
+        cache = self._diameter_cache
+        if key in cache:
+            cache.move_to_end(key)
+        else:
+            cache[key] = self._compute_bundle_diameter(path, consider_hierarchy)
+            if len(cache) > DIAMETER_CACHE_SIZE:
+                cache.popitem(last=False)
+        
+        result = cache[key]
+        if isinstance(result, dict):
+            return dict(result)
+        if isinstance(result, tuple):
+            # Segment diameters and space utilization
+            return tuple(dict(part) for part in result)
+        return result
+    
+    def _compute_bundle_diameter(self, path, consider_hierarchy):
+        """Uncached implementation of estimate_bundle_diameter"""
         if path:
-            # Calculate for specific path
-            edges = [(path[i], path[i+1]) for i in range(len(path)-1)]
-            diameters = []
+            # A single node has no segments to bundle
+            if len(path) < 2:
+                return 0.0
             
-            for u, v in edges:
-                if self.harness_graph.has_edge(u, v):
-                    gauge = self.harness_graph[u][v]["gauge"]
-                    diameters.append(gauge_to_diameter.get(gauge, 0.8))  # Default if gauge not found
+            # Calculate for specific path, skipping hops that are not segments
+            edge_index = self._edge_index
+            rows = [edge_index.get((u, v), edge_index.get((v, u))) for u, v in zip(path, path[1:])]
+            rows = np.array([row for row in rows if row is not None], dtype=np.int64)
+            diameters = wire_diameters(self.edge_gauge[rows])
             
-            # Simple estimation: sum of wire cross-sectional areas
-            total_area = sum([(d/2)**2 * np.pi for d in diameters])
-            bundle_diameter = 2 * np.sqrt(total_area / np.pi)
+            # Simple estimation: sum of wire cross-sectional areas, which
+            # reduces to the root of the summed squared diameters
+            bundle_diameter = math.sqrt(float(diameters @ diameters))
             
             return bundle_diameter
         
         elif consider_hierarchy:
             # Calculate bundle diameters considering hierarchy
-            segment_diameters = {}
-            space_utilization = {}
-            
-            # Calculate base diameters for each segment
-            for u, v, data in self.harness_graph.edges(data=True):
-                gauge = data.get("gauge", 20)  # Default to 20 AWG if not specified
-                wire_diameter = gauge_to_diameter.get(gauge, 0.8)  # Default if gauge not found
-                num_signals = len(data.get("signals", [1]))  # Count number of signals
-                
-                # Simple diameter for this segment alone
-                segment_area = num_signals * (wire_diameter/2)**2 * np.pi
-                segment_diameters[(u, v)] = 2 * np.sqrt(segment_area / np.pi)
+            is_junction = np.isin(self.node_type, JUNCTION_TYPES)
+            diameters, utilization, util_order, n_util = bundle_diameter_csr(
+                self.adj_indptr, self.adj_indices, self.adj_edge, 
+                self.edge_gauge, self.edge_nsig, is_junction)
             
-            # Calculate bundle diameters at junctions considering downstream branches
-            junction_nodes = [node for node, data in self.harness_graph.nodes(data=True) 
-                             if data.get("type") in ["junction", "sub_junction"]]
-            
-            # Process junctions from leaf to root
-            for junction in sorted(junction_nodes, 
-                                   key=lambda j: len(self.get_downstream_edges(j)), 
-                                   reverse=False):
-                # Get all downstream edges
-                downstream_edges = self.get_downstream_edges(junction)
-                
-                # Calculate total area of downstream wires
-                total_downstream_area = 0
-                for u, v in downstream_edges:
-                    if (u, v) in segment_diameters:
-                        diameter = segment_diameters[(u, v)]
-                        area = (diameter/2)**2 * np.pi
-                        total_downstream_area += area
-                
-                # Get edges connecting to this junction
-                incoming_edges = []
-                for u, v in self.harness_graph.edges():
-                    if u == junction or v == junction:
-                        # Make sure it's properly oriented (other_node, junction)
-                        other_node = v if u == junction else u
-                        edge = (other_node, junction) if u == junction else (junction, other_node)
-                        incoming_edges.append(edge)
-                
-                # Update diameter for all incoming edges to account for downstream wires
-                for edge in incoming_edges:
-                    u, v = edge
-                    
-                    # Skip if this is a downstream edge
-                    is_downstream = False
-                    for du, dv in downstream_edges:
-                        if (u == du and v == dv) or (u == dv and v == du):
-                            is_downstream = True
-                            break
-                    
-                    if is_downstream:
-                        continue
-                    
-                    # Calculate base area for this segment
-                    base_diameter = segment_diameters.get((u, v), segment_diameters.get((v, u), 0))
-                    base_area = (base_diameter/2)**2 * np.pi
-                    
-                    # Combine with downstream area
-                    total_area = base_area + total_downstream_area
-                    if total_area > 0:  # Ensure we don't have zero area
-                        new_diameter = 2 * np.sqrt(total_area / np.pi)
-                        
-                        # Update diameter
-                        segment_diameters[(u, v)] = new_diameter
-                        segment_diameters[(v, u)] = new_diameter  # Update both directions
-                        
-                        # Calculate space utilization
-                        space_utilization[(u, v)] = (base_area / total_area) * 100
-                        space_utilization[(v, u)] = space_utilization[(u, v)]
+            segment_diameters = dict(zip(self._edge_keys, diameters.tolist()))
+            utilization = utilization.tolist()
+            space_utilization = {self._edge_keys[e]: utilization[e] for e in util_order[:n_util].tolist()}
             
             # Ensure we have at least one value in space_utilization
             if not space_utilization:
                 # Add default utilization values if none were calculated
-                for u, v in segment_diameters.keys():
-                    space_utilization[(u, v)] = 100.0  # If there's no bundling, utilization is 100%
+                for edge in segment_diameters:
+                    space_utilization[edge] = 100.0  # If there's no bundling, utilization is 100%
             
             return segment_diameters, space_utilization
             
         else:
             # Original calculation for each segment independently
-            segment_diameters = {}
-            
-            for u, v, data in self.harness_graph.edges(data=True):
-                gauge = data.get("gauge", 20)  # Default to 20 AWG if not specified
-                wire_diameter = gauge_to_diameter.get(gauge, 0.8)  # Default if gauge not found
-                num_signals = len(data.get("signals", [1]))  # Count number of signals
-                
-                # Simple bundle estimation: assuming circular packing of wires
-                bundle_area = num_signals * (wire_diameter/2)**2 * np.pi
-                bundle_diameter = 2 * np.sqrt(bundle_area / np.pi)
-                
-                segment_diameters[(u, v)] = bundle_diameter
-            
-            return segment_diameters
+            return self._segment_diameters()
+    
+    def _segment_diameters(self):
+        """Calculate the bundle diameter of every segment on its own in one vectorized pass"""
+        bundle_diameters = segment_diameters(self.edge_gauge, self.edge_nsig)
+        return dict(zip(self._edge_keys, bundle_diameters.tolist()))
     
     def find_optimal_path(self, source, target, weight='length'):
         """Find optimal path between two nodes using Dijkstra's algorithm
@@ -255,36 +418,79 @@ class HarnessAnalyzer:
             target (str): Target node name
             weight (str): Edge attribute to use as weight (default: length)
         """
-        try:
-            path = nx.dijkstra_path(self.harness_graph, source, target, weight=weight)
-            length = nx.dijkstra_path_length(self.harness_graph, source, target, weight=weight)
-            return path, length
-        except nx.NetworkXNoPath:
+        node_to_idx = self._node_index
+        for node in (source, target):
+            if node not in node_to_idx:
+                raise nx.NodeNotFound(f"Node {node} not found in graph")
+        
+        src, tgt = node_to_idx[source], node_to_idx[target]
+        
+        # Wires are undirected, so a tree already grown from the target past the
+        # source answers the query as well
+        root, leaf = src, tgt
+        forward = self._sssp_cache.get((self._graph_version, src, weight))
+        backward = self._sssp_cache.get((self._graph_version, tgt, weight))
+        if (forward is None or not forward[2][tgt]) and backward is not None and backward[2][src]:
+            root, leaf = tgt, src
+        
+        dist, prev = self._shortest_path_tree(root, weight, leaf)
+        if np.isinf(dist[leaf]):
             return None, float('inf')
+        
+        # Walk the predecessors back to the root of the tree
+        path = [leaf]
+        while path[-1] != root:
+            path.append(prev[path[-1]])
+        if root == src:
+            path.reverse()
+        
+        return [self.nodes[i] for i in path], float(dist[leaf])
     
-    def estimate_installation_complexity(self, path=None):
+    def _shortest_path_tree(self, src, weight, tgt=-1):
+        """Distances and predecessors from a source node index, final at least for tgt
+        
+        The search stops once tgt is settled (-1 searches the whole graph). Trees
+        are cached per source until the graph is next modified, and a cached tree
+        answers every target it already settled without running Dijkstra again.
+        """
+        key = (self._graph_version, src, weight)
+        tree = self._sssp_cache.get(key)
+        if tree is None or (tgt >= 0 and not tree[2][tgt]):
+            # A later target is settled after every node the cached tree had, so this replaces it
+            tree = self._sssp_cache[key] = dijkstra_csr(self.adj_indptr, self.adj_indices, 
+                                                        self._adj_weights(weight), src, tgt)
+        return tree[0], tree[1]
+    
+    def _adj_weights(self, weight):
+        """Weight of each adjacency entry, cached until the graph is next modified
+        
+        Edges missing the weight attribute count as 1, as in NetworkX.
+        """
+        key = (self._graph_version, weight)
+        if key not in self._adj_weight_cache:
+            adj = self.harness_graph._adj
+            edge_weight = np.array([adj[u][v].get(weight, 1) for u, v in self._edge_keys], dtype=np.float64)
+            self._adj_weight_cache[key] = edge_weight[self.adj_edge]
+        return self._adj_weight_cache[key]
+    
+    def estimate_installation_complexity(self, path=None, bundle_diameter=None):
         """Estimate installation complexity based on bundle diameter and path length
         
         Returns a score from 1-10 where higher means more complex
+        
+        Args:
+            path (list): Optional path of nodes; if None, scores the entire harness
+            bundle_diameter (float): Optional precomputed bundle diameter of the path
         """
         if not path:
             # For entire harness
-            total_length = self.calculate_total_length()
-            diameters, _ = self.estimate_bundle_diameter(consider_hierarchy=True)
-            avg_diameter = np.mean(list(diameters.values())) if diameters else 0
-            num_junctions = sum(1 for node, data in self.harness_graph.nodes(data=True) 
-                               if data.get("type") in ["junction", "sub_junction"])
-            
-            # Simple complexity formula
-            complexity = (total_length * avg_diameter * 0.5) + (num_junctions * 1.5)
-            
-            # Scale to 1-10
-            return min(10, max(1, complexity))
+            return self._aggregate()["complexity"]
         else:
             # For specific path
-            path_length = sum(self.harness_graph[path[i]][path[i+1]]["length"] 
-                             for i in range(len(path)-1))
-            bundle_diameter = self.estimate_bundle_diameter(path)
+            adj = self.harness_graph._adj
+            path_length = sum(adj[u][v]["length"] for u, v in zip(path, path[1:]))
+            if bundle_diameter is None:
+                bundle_diameter = self.estimate_bundle_diameter(path)
             
             # Simple complexity formula for path
             complexity = path_length * bundle_diameter * 0.8
@@ -292,9 +498,60 @@ class HarnessAnalyzer:
             # Scale to 1-10
             return min(10, max(1, complexity))
     
+    def _aggregate(self):
+        """Harness-wide totals shared by the report and the complexity score,
+        cached until the graph is next modified"""
+        key = self._graph_version
+        if key not in self._aggregate_cache:
+            diameters = self.estimate_bundle_diameter(consider_hierarchy=True)[0]
+            values = np.fromiter(diameters.values(), dtype=np.float64, count=len(diameters))
+            self._aggregate_cache[key] = report_totals(
+                self.edge_length, values, int(self._type_counts[JUNCTION_TYPES].sum()))
+        return self._aggregate_cache[key]
+    
+    def _render_attributes(self):
+        """Per-node and per-edge drawing attributes, cached until the graph is next modified"""
+        key = self._graph_version
+        if key not in self._render_cache:
+            self._render_cache[key] = {
+                "node_colors": NODE_COLOR_LUT[self.node_type].tolist(),
+                "node_sizes": NODE_SIZE_LUT[self.node_type].tolist(),
+                "edge_colors": EDGE_COLOR_LUT[self.edge_wire_type].tolist(),
+                "edge_widths": (1 + (24 - self.edge_awg) / 3).tolist(),
+            }
+        return self._render_cache[key]
+    
+    def _edge_labels(self, show_diameters, show_utilization):
+        """Edge label strings, cached until the graph is next modified"""
+        key = (show_diameters, show_utilization, self._graph_version)
+        if key in self._edge_label_cache:
+            return self._edge_label_cache[key]
+        
+        # Calculate bundle diameters and space utilization if needed
+        if show_diameters or show_utilization:
+            diameters, utilization = self.estimate_bundle_diameter(consider_hierarchy=True)
+        
+        edge_labels = {}
+        for (u, v), label in zip(self._edge_keys, self._edge_gauge_labels):
+            if show_diameters and (u, v) in diameters:
+                diameter = round(diameters.get((u, v), 0), 2)
+                label += f"\n{diameter}mm"
+                
+            if show_utilization and (u, v) in utilization:
+                util = round(utilization.get((u, v), 0), 1)
+                label += f"\n{util}%"
+                
+            edge_labels[(u, v)] = label
+        
+        self._edge_label_cache[key] = edge_labels
+        return edge_labels
+    
     def visualize_harness(self, ax=None, highlight_path=None, show_diameters=False, show_utilization=False):
         """Visualize the wire harness
         
+        The drawn artists are kept, so later calls on the same axes for an
+        unchanged graph only update the edge label text and the path highlight.
+        
         Args:
             ax (matplotlib.axes): Optional matplotlib axes to plot on
             highlight_path (list): Optional list of nodes to highlight
@@ -304,86 +561,96 @@ class HarnessAnalyzer:
         if ax is None:
             fig, ax = plt.subplots(figsize=(12, 10))
         
-        # Calculate bundle diameters and space utilization if needed
-        if show_diameters or show_utilization:
-            diameters, utilization = self.estimate_bundle_diameter(consider_hierarchy=True)
+        edge_labels = self._edge_labels(show_diameters, show_utilization)
         
-        # Create node colors based on type
-        node_colors = []
-        node_sizes = []
-        for node in self.harness_graph.nodes():
-            node_type = self.harness_graph.nodes[node].get("type", "")
-            if node_type == "controller":
-                node_colors.append('red')
-                node_sizes.append(600)
-            elif node_type == "sensor":
-                node_colors.append('green')
-                node_sizes.append(500)
-            elif node_type == "actuator":
-                node_colors.append('blue')
-                node_sizes.append(500)
-            elif node_type == "junction":
-                node_colors.append('orange')
-                node_sizes.append(450)
-            elif node_type == "sub_junction":
-                node_colors.append('yellow')
-                node_sizes.append(350)
-            else:
-                node_colors.append('gray')
-                node_sizes.append(400)
-        
-        # Draw the network
-        nx.draw_networkx_nodes(self.harness_graph, self.node_positions, 
-                              node_color=node_colors, node_size=node_sizes, ax=ax)
-        
-        # Draw edges with colors based on wire type
-        edge_colors = []
-        edge_widths = []
-        for u, v, data in self.harness_graph.edges(data=True):
-            wire_type = data.get("wire_type", "")
-            if wire_type == "power":
-                edge_colors.append('red')
-            elif wire_type == "signal":
-                edge_colors.append('blue')
-            else:
-                edge_colors.append('black')
-                
-            # Adjust edge width based on gauge
-            gauge = data.get("gauge", 20)
-            edge_widths.append(1 + (24 - gauge) / 3)  # Thicker lines for lower gauges
+        artists = self._artists
+        if (artists is not None and self._artists_version != self._graph_version 
+                and artists["highlight"].axes is ax):
+            # The graph changed since the last drawing on these axes
+            self.invalidate_visualization()
         
-        nx.draw_networkx_edges(self.harness_graph, self.node_positions, 
-                              edge_color=edge_colors, width=edge_widths, ax=ax)
+        artists = self._artists
+        if artists is None or artists["highlight"].axes is not ax:
+            self._build_artists(ax, edge_labels)
+        self._update_artists(highlight_path, edge_labels)
         
-        # Draw edge labels
-        edge_labels = {}
-        for u, v, data in self.harness_graph.edges(data=True):
-            label = f"{data.get('gauge', '')}AWG"
+        return ax
+    
+    def invalidate_visualization(self):
+        """Take the kept harness artists off their axes, so the next
+        visualize_harness call draws the harness from scratch"""
+        if self._artists is not None:
+            ax = self._artists["highlight"].axes
+            for artist in self._artists.values():
+                if isinstance(artist, dict):
+                    parts = list(artist.values())
+                elif isinstance(artist, list):
+                    parts = artist
+                else:
+                    parts = [artist]
+                for part in parts:
+                    if part.axes is not None:
+                        part.remove()
             
-            if show_diameters and (u, v) in diameters:
-                diameter = round(diameters.get((u, v), 0), 2)
-                label += f"\n{diameter}mm"
-                
-            if show_utilization and (u, v) in utilization:
-                util = round(utilization.get((u, v), 0), 1)
-                label += f"\n{util}%"
-                
-            edge_labels[(u, v)] = label
+            # Let the next drawing fit the view to the current layout again
+            if ax is not None:
+                ax.relim()
+                ax.set_autoscale_on(True)
+        
+        self._artists = None
+        self._artists_version = None
+        self.highlight_artist = None
+    
+    def _build_artists(self, ax, edge_labels):
+        """Draw the static harness on the axes and keep the created artists"""
+        # Node colors/sizes based on type, edge colors based on wire type
+        # and widths based on gauge (thicker lines for lower gauges)
+        render = self._render_attributes()
+        
+        # Draw the network straight from the position array; nodes sit above edges
+        pos = self.node_pos
+        nodes = ax.scatter(pos[:, 0], pos[:, 1], s=render["node_sizes"], c=render["node_colors"], marker='o', zorder=2)
+        
+        segments = pos[np.stack([self.edge_src, self.edge_dst], axis=1)]
+        edges = LineCollection(segments, colors=render["edge_colors"], linewidths=render["edge_widths"], 
+                               antialiaseds=(1,), zorder=1)
+        ax.add_collection(edges)
+        if len(segments):
+            # Pad the data limits around the wires by 5%, as NetworkX does
+            low, high = segments.reshape(-1, 2).min(axis=0), segments.reshape(-1, 2).max(axis=0)
+            pad = 0.05 * (high - low)
+            ax.update_datalim([low - pad, high + pad])
+            ax.autoscale_view()
         
-        nx.draw_networkx_edge_labels(self.harness_graph, self.node_positions, 
-                                    edge_labels=edge_labels, ax=ax)
+        # Draw edge labels
+        edge_label_artists = self._draw_edge_labels(ax, edge_labels)
         
         # Draw node labels
-        nx.draw_networkx_labels(self.harness_graph, self.node_positions, font_weight='bold', ax=ax)
-        
-        # Highlight path if provided
-        if highlight_path and len(highlight_path) > 1:
-            path_edges = [(highlight_path[i], highlight_path[i+1]) for i in range(len(highlight_path)-1)]
-            nx.draw_networkx_edges(self.harness_graph, self.node_positions, 
-                                  edgelist=path_edges, edge_color='yellow', 
-                                  width=4, ax=ax)
+        node_label_artists = nx.draw_networkx_labels(self.harness_graph, self.node_positions, 
+                                                     font_weight='bold', ax=ax)
+        
+        # Path highlight, filled in by _update_artists
+        self.highlight_artist = LineCollection([], colors='yellow', linewidths=4, 
+                                               antialiaseds=(1,), zorder=1)
+        ax.add_collection(self.highlight_artist)
+        
+        self._init_axes(ax)
+        self._pin_view_limits(ax)
+        
+        self._artists = {
+            "nodes": nodes,
+            "edges": edges,
+            "edge_labels": edge_label_artists,
+            "node_labels": node_label_artists,
+            "highlight": self.highlight_artist,
+        }
+        self._artists_version = self._graph_version
+    
+    def _init_axes(self, ax):
+        """Add the legend, title and axis styling, unless the axes already has them"""
+        if self._legend is not None and ax.get_legend() is self._legend:
+            return
         
-        # Add legend
         legend_elements = [
             plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='red', markersize=10, label='Controller'),
             plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='green', markersize=10, label='Sensor'),
@@ -391,12 +658,48 @@ class HarnessAnalyzer:
             plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='orange', markersize=10, label='Junction'),
             plt.Line2D([0], [0], marker='o', color='w', markerfacecolor='yellow', markersize=10, label='Sub-Junction')
         ]
-        ax.legend(handles=legend_elements, loc='upper right')
+        self._legend = ax.legend(handles=legend_elements, loc='upper right')
         
         ax.set_title("Wire Harness Layout")
         ax.set_axis_off()
+    
+    def _pin_view_limits(self, ax):
+        """Freeze the axes limits fitted to the node layout, so later redraws of
+        the reused artists skip the data limit recomputation"""
+        ax.set_xlim(ax.get_xlim())
+        ax.set_ylim(ax.get_ylim())
+        ax.set_autoscale_on(False)
+    
+    def _draw_edge_labels(self, ax, edge_labels):
+        """Draw each edge label at the middle of its wire, turned along the wire"""
+        start, end = self.node_pos[self.edge_src], self.node_pos[self.edge_dst]
+        middles = 0.5 * (start + end)
+        delta = end - start
+        angles = np.degrees(np.arctan2(delta[:, 1], delta[:, 0]))
+        
+        # Keep the text the right way up
+        angles[angles > 90] -= 180
+        angles[angles < -90] += 180
+        
+        # White rounded box behind each label
+        bbox = {"boxstyle": "round", "ec": (1.0, 1.0, 1.0), "fc": (1.0, 1.0, 1.0)}
+        return {edge: ax.text(x, y, edge_labels[edge], size=10, color='k', family='sans-serif', 
+                              horizontalalignment='center', verticalalignment='center', 
+                              rotation=angle, transform_rotates_text=True, 
+                              bbox=bbox, zorder=1, clip_on=True)
+                for edge, (x, y), angle in zip(self._edge_keys, middles.tolist(), angles.tolist())}
+    
+    def _update_artists(self, highlight_path, edge_labels):
+        """Update edge label text and point the path highlight at the given path"""
+        for edge, text in self._artists["edge_labels"].items():
+            if text.get_text() != edge_labels[edge]:
+                text.set_text(edge_labels[edge])
         
-        return ax
+        segments = []
+        if highlight_path and len(highlight_path) > 1:
+            rows = [self._node_index[node] for node in highlight_path]
+            segments = self.node_pos[np.stack([rows[:-1], rows[1:]], axis=1)]
+        self.highlight_artist.set_segments(segments)
     
     def generate_report(self, include_utilization=True):
         """Generate a summary report of the harness analysis
@@ -404,42 +707,28 @@ class HarnessAnalyzer:
         Args:
             include_utilization (bool): Whether to include space utilization stats
         """
-        total_length = self.calculate_total_length()
+        aggregate = self._aggregate()
+        total_length = aggregate["total_length"]
+        avg_diameter = aggregate["avg_diameter"]
+        max_diameter = aggregate["max_diameter"]
         
         if include_utilization:
-            diameters, utilization = self.estimate_bundle_diameter(consider_hierarchy=True)
+            _, utilization = self.estimate_bundle_diameter(consider_hierarchy=True)
             
-            # Check if we have valid diameter values
-            if diameters:
-                avg_diameter = np.mean(list(diameters.values()))
-                max_diameter = max(diameters.values())
-            else:
-                avg_diameter = 0
-                max_diameter = 0
-                
             # Check if we have valid utilization values
             if utilization:
-                avg_utilization = np.mean(list(utilization.values()))
+                avg_utilization = sum(utilization.values()) / len(utilization)
                 min_utilization = min(utilization.values())
             else:
                 avg_utilization = 0
                 min_utilization = 0
-        else:
-            diameters = self.estimate_bundle_diameter()
-            if diameters:
-                avg_diameter = np.mean(list(diameters.values()))
-                max_diameter = max(diameters.values())
-            else:
-                avg_diameter = 0
-                max_diameter = 0
         
         installation_complexity = self.estimate_installation_complexity()
         
         # Calculate network properties
         num_components = self.harness_graph.number_of_nodes()
         num_connections = self.harness_graph.number_of_edges()
-        num_junctions = sum(1 for node, data in self.harness_graph.nodes(data=True) 
-                           if data.get("type") in ["junction", "sub_junction"])
+        num_junctions = aggregate["num_junctions"]
         
         report = {
             "Total Components": num_components,
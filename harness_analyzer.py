@@ -1,8 +1,52 @@
 
+import math
+from collections import OrderedDict
+from enum import IntEnum
+
 import networkx as nx
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+
+from harness_kernels import dijkstra_csr, gauge_index, report_totals, segment_diameters, wire_diameters
+
+
+class NodeType(IntEnum):
+    """Integer node type codes; 0 is left for unknown types"""
+    CONTROLLER = 1
+    SENSOR = 2
+    ACTUATOR = 3
+    JUNCTION = 4
+
+
+class WireType(IntEnum):
+    """Integer wire type codes; 0 is left for unknown types"""
+    POWER = 1
+    SIGNAL = 2
+
+
+# Graph type strings to codes, e.g. "junction" -> NodeType.JUNCTION
+NODE_TYPE_INDEX = {node_type.name.lower(): node_type for node_type in NodeType}
+WIRE_TYPE_INDEX = {wire_type.name.lower(): wire_type for wire_type in WireType}
+
+# Drawing lookup tables indexed by type code; index 0 is the fallback for unknown types
+NODE_COLOR_LUT = np.array(['gray', 'red', 'green', 'blue', 'orange'])
+EDGE_COLOR_LUT = np.array(['black', 'red', 'blue'])
+
+# Gauge label text per AWG number, shared by every edge with that gauge
+AWG_LABELS = tuple(f"{gauge}AWG" for gauge in range(32))
+
+
+def awg_label(gauge):
+    """Edge label text for a gauge, reusing the prebuilt string where there is one"""
+    if type(gauge) is int and 0 <= gauge < len(AWG_LABELS):
+        return AWG_LABELS[gauge]
+    return f"{gauge}AWG"
+
+
+# Bundle diameter results kept per graph version, least recently used evicted first
+DIAMETER_CACHE_SIZE = 64
 
 
 class HarnessAnalyzer:
@@ -10,8 +54,44 @@ class HarnessAnalyzer:
         self.harness_graph = nx.Graph()
         self.node_positions = {}
         
+        # Struct-of-arrays copy of the graph, rebuilt by _build_arrays
+        self.nodes = []
+        self.node_type = np.zeros(0, dtype=np.int8)
+        self._type_counts = np.zeros(len(NodeType) + 1, dtype=np.int64)
+        self.node_pos = np.zeros((0, 2), dtype=np.float64)
+        self.edge_src = np.zeros(0, dtype=np.int32)
+        self.edge_dst = np.zeros(0, dtype=np.int32)
+        self.edge_gauge = np.zeros(0, dtype=np.int8)
+        self.edge_nsig = np.zeros(0, dtype=np.int16)
+        self.edge_length = np.zeros(0, dtype=np.float64)
+        self.edge_wire_type = np.zeros(0, dtype=np.int8)
+        self.adj_indptr = np.zeros(1, dtype=np.int64)
+        self.adj_indices = np.zeros(0, dtype=np.int64)
+        self.adj_edge = np.zeros(0, dtype=np.int64)
+        self._node_index = {}
+        self._edge_keys = []
+        self._edge_gauge_labels = []
+        self._edge_index = {}
+        
+        # Bumped on every graph mutation to invalidate cached results
+        self._graph_version = 0
+        self._diameter_cache = OrderedDict()
+        self._aggregate_cache = {}
+        self._adj_weight_cache = {}
+        self._sssp_cache = {}
+        self._render_cache = {}
+        
+        # Artists from the last visualize_harness call and the graph version they show
+        self._artists = None
+        self._artists_version = None
+        self.highlight_artist = None
+        
     def load_sample_data(self):
-        """Load sample wire harness data"""
+        """Load sample wire harness data
+        
+        Returns:
+            nx.Graph: The harness graph; call refresh() after editing it directly
+        """
         # Create nodes (connectors/components)
         nodes = [
             ("ECU", {"type": "controller", "position": (0, 0)}),
@@ -34,66 +114,181 @@ class HarnessAnalyzer:
         ]
         
         # Create graph
-        self.harness_graph.add_nodes_from(nodes)
-        self.harness_graph.add_edges_from(edges)
+        self._fill_graph(nodes, edges)
+        self.refresh()
         
+        return self.harness_graph
+    
+    def refresh(self):
+        """Rebuild the analysis state after harness_graph has been edited
+        
+        Every analysis reads a NumPy copy of the graph, so direct edits to
+        harness_graph must be followed by a call to this method; until then,
+        results describe the graph as it was. add_node and add_edge call it
+        themselves.
+        """
         # Store node positions for visualization
-        self.node_positions = {node: data["position"] for node, data in self.harness_graph.nodes(data=True)}
+        self.node_positions = {node: data["position"] for node, data in self.harness_graph.nodes(data=True) 
+                               if "position" in data}
         
-        return self.harness_graph
+        # Drop results cached for the old graph and rebuild its array mirror
+        self._invalidate_cache()
+        self._build_arrays()
+    
+    def add_node(self, node, **attrs):
+        """Add a node to the harness, or update its attributes, and refresh the analysis state
+        
+        Args:
+            node (str): Node name
+            **attrs: Node attributes such as type and position
+        """
+        self.harness_graph.add_node(node, **attrs)
+        self.refresh()
+    
+    def add_edge(self, u, v, **attrs):
+        """Add a wire segment to the harness, or update its attributes, and refresh the analysis state
+        
+        Args:
+            u, v (str): End nodes, added if not already in the harness
+            **attrs: Segment attributes such as wire_type, gauge, length and signals
+        """
+        self.harness_graph.add_edge(u, v, **attrs)
+        self.refresh()
+    
+    def _fill_graph(self, nodes, edges):
+        """Add nodes and edges by writing the graph's node and adjacency dicts directly
+        
+        Same result as add_nodes_from/add_edges_from, including attribute merging
+        on reload and one shared data dict per undirected edge, without NetworkX's
+        per-item argument handling.
+        """
+        graph = self.harness_graph
+        node_data, adj = graph._node, graph._adj
+        for node, attrs in nodes:
+            node_data.setdefault(node, {}).update(attrs)
+            adj.setdefault(node, {})
+        
+        for u, v, attrs in edges:
+            for node in (u, v):
+                if node not in node_data:
+                    node_data[node] = {}
+                    adj[node] = {}
+            data = adj[u].get(v, {})
+            data.update(attrs)
+            adj[u][v] = data
+            adj[v][u] = data
+        
+        # Drop anything NetworkX cached for the old structure
+        getattr(graph, "__networkx_cache__", {}).clear()
+    
+    def _invalidate_cache(self):
+        """Mark the graph as changed so cached results are recomputed"""
+        self._graph_version += 1
+        self._diameter_cache.clear()
+        self._aggregate_cache.clear()
+        self._adj_weight_cache.clear()
+        self._sssp_cache.clear()
+        self._render_cache.clear()
+    
+    def _build_arrays(self):
+        """Copy node and edge attributes into flat NumPy arrays for vectorized passes"""
+        graph = self.harness_graph
+        self.nodes = list(graph.nodes())
+        self._node_index = node_to_idx = {node: i for i, node in enumerate(self.nodes)}
+        
+        self.node_type = np.array([NODE_TYPE_INDEX.get(data.get("type", ""), 0) 
+                                   for _, data in graph.nodes(data=True)], dtype=np.int8)
+        # Node counts per type code; rebuilt here on every refresh(), so add_node keeps them live
+        self._type_counts = np.bincount(self.node_type, minlength=len(NodeType) + 1)
+        # Nodes without a position can still be analyzed; they are NaN here and cannot be drawn
+        self.node_pos = np.array([self.node_positions.get(node, (np.nan, np.nan)) for node in self.nodes], 
+                                 dtype=np.float64).reshape(-1, 2)
+        
+        edges = list(graph.edges(data=True))
+        self._edge_keys = [(u, v) for u, v, _ in edges]
+        self._edge_gauge_labels = [awg_label(data.get("gauge", "")) for _, _, data in edges]
+        self._edge_index = {key: i for i, key in enumerate(self._edge_keys)}
+        self.edge_src = np.array([node_to_idx[u] for u, _, _ in edges], dtype=np.int32)
+        self.edge_dst = np.array([node_to_idx[v] for _, v, _ in edges], dtype=np.int32)
+        
+        # Default to 20 AWG and one signal per segment if not specified
+        # Gauges without a tabulated diameter fold onto the default slot, so the int8 column never overflows
+        self.edge_gauge = np.array([gauge_index(data.get("gauge", 20)) for _, _, data in edges], dtype=np.int8)
+        self.edge_nsig = np.fromiter((len(data["signals"]) if "signals" in data else 1 for _, _, data in edges), 
+                                     dtype=np.int16, count=len(edges))
+        self.edge_length = np.array([data.get("length", 0.0) for _, _, data in edges], dtype=np.float64)
+        self.edge_wire_type = np.array([WIRE_TYPE_INDEX.get(data.get("wire_type", ""), 0) for _, _, data in edges], 
+                                       dtype=np.int8)
+        
+        # CSR adjacency in the graph's own neighbor order, with the edge row of each entry
+        self.adj_indptr = np.zeros(len(self.nodes) + 1, dtype=np.int64)
+        adj = graph._adj
+        indices = []
+        adj_edge = []
+        for i, node in enumerate(self.nodes):
+            for neighbor in adj[node]:
+                indices.append(node_to_idx[neighbor])
+                adj_edge.append(self._edge_index[self._edge_key(node, neighbor)])
+            self.adj_indptr[i + 1] = len(indices)
+        self.adj_indices = np.array(indices, dtype=np.int64)
+        self.adj_edge = np.array(adj_edge, dtype=np.int64)
+    
+    def _edge_key(self, u, v):
+        """Canonical (u, v) key of an undirected edge, matching the graph's own orientation"""
+        return (u, v) if (u, v) in self._edge_index else (v, u)
     
     def calculate_total_length(self):
         """Calculate the total wire length in the harness"""
-        total_length = sum(data["length"] for _, _, data in self.harness_graph.edges(data=True))
-        return total_length
+        return float(self.edge_length.sum())
     
     def estimate_bundle_diameter(self, path=None):
         """Estimate wire bundle diameter based on wire gauges
         
+        The last DIAMETER_CACHE_SIZE results are cached until the graph is next
+        modified. Callers get their own copy, so they may modify it freely.
+        
         Args:
             path (list): Optional path of nodes to calculate diameter for a specific segment
                          If None, calculates for each segment
         """
-        # Wire gauge to diameter mapping (AWG to mm)
-        gauge_to_diameter = {
-            16: 1.29,
-            18: 1.02,
-            20: 0.81,
-            22: 0.64,
-            24: 0.51
-        }
+        key = (self._graph_version, tuple(path) if path else None)
+        cache = self._diameter_cache
+        if key in cache:
+            cache.move_to_end(key)
+        else:
+            cache[key] = self._compute_bundle_diameter(path)
+            if len(cache) > DIAMETER_CACHE_SIZE:
+                cache.popitem(last=False)
         
+        result = cache[key]
+        return dict(result) if isinstance(result, dict) else result
+    
+    def _compute_bundle_diameter(self, path):
+        """Uncached implementation of estimate_bundle_diameter"""
         if path:
-            # Calculate for specific path
-            edges = [(path[i], path[i+1]) for i in range(len(path)-1)]
-            diameters = []
+            # A single node has no segments to bundle
+            if len(path) < 2:
+                return 0.0
             
-            for u, v in edges:
-                if self.harness_graph.has_edge(u, v):
-                    gauge = self.harness_graph[u][v]["gauge"]
-                    diameters.append(gauge_to_diameter.get(gauge, 0.8))  # Default if gauge not found
+            # Calculate for specific path, skipping hops that are not segments
+            edge_index = self._edge_index
+            rows = [edge_index.get((u, v), edge_index.get((v, u))) for u, v in zip(path, path[1:])]
+            rows = np.array([row for row in rows if row is not None], dtype=np.int64)
+            diameters = wire_diameters(self.edge_gauge[rows])
             
-            # Simple estimation: sum of wire cross-sectional areas
-            total_area = sum([(d/2)**2 * np.pi for d in diameters])
-            bundle_diameter = 2 * np.sqrt(total_area / np.pi)
+            # Simple estimation: sum of wire cross-sectional areas, which
+            # reduces to the root of the summed squared diameters
+            bundle_diameter = math.sqrt(float(diameters @ diameters))
             
             return bundle_diameter
         else:
             # Calculate for each segment
-            segment_diameters = {}
-            
-            for u, v, data in self.harness_graph.edges(data=True):
-                gauge = data.get("gauge", 20)  # Default to 20 AWG if not specified
-                wire_diameter = gauge_to_diameter.get(gauge, 0.8)  # Default if gauge not found
-                num_signals = len(data.get("signals", [1]))  # Count number of signals
-                
-                # Simple bundle estimation: assuming circular packing of wires
-                bundle_area = num_signals * (wire_diameter/2)**2 * np.pi
-                bundle_diameter = 2 * np.sqrt(bundle_area / np.pi)
-                
-                segment_diameters[(u, v)] = bundle_diameter
-            
-            return segment_diameters
+            return self._segment_diameters()
+    
+    def _segment_diameters(self):
+        """Calculate the bundle diameter of every segment on its own in one vectorized pass"""
+        bundle_diameters = segment_diameters(self.edge_gauge, self.edge_nsig)
+        return dict(zip(self._edge_keys, bundle_diameters.tolist()))
     
     def find_optimal_path(self, source, target, weight='length'):
         """Find optimal path between two nodes using Dijkstra's algorithm
@@ -103,35 +298,79 @@ class HarnessAnalyzer:
             target (str): Target node name
             weight (str): Edge attribute to use as weight (default: length)
         """
-        try:
-            path = nx.dijkstra_path(self.harness_graph, source, target, weight=weight)
-            length = nx.dijkstra_path_length(self.harness_graph, source, target, weight=weight)
-            return path, length
-        except nx.NetworkXNoPath:
+        node_to_idx = self._node_index
+        for node in (source, target):
+            if node not in node_to_idx:
+                raise nx.NodeNotFound(f"Node {node} not found in graph")
+        
+        src, tgt = node_to_idx[source], node_to_idx[target]
+        
+        # Wires are undirected, so a tree already grown from the target past the
+        # source answers the query as well
+        root, leaf = src, tgt
+        forward = self._sssp_cache.get((self._graph_version, src, weight))
+        backward = self._sssp_cache.get((self._graph_version, tgt, weight))
+        if (forward is None or not forward[2][tgt]) and backward is not None and backward[2][src]:
+            root, leaf = tgt, src
+        
+        dist, prev = self._shortest_path_tree(root, weight, leaf)
+        if np.isinf(dist[leaf]):
             return None, float('inf')
+        
+        # Walk the predecessors back to the root of the tree
+        path = [leaf]
+        while path[-1] != root:
+            path.append(prev[path[-1]])
+        if root == src:
+            path.reverse()
+        
+        return [self.nodes[i] for i in path], float(dist[leaf])
     
-    def estimate_installation_complexity(self, path=None):
+    def _shortest_path_tree(self, src, weight, tgt=-1):
+        """Distances and predecessors from a source node index, final at least for tgt
+        
+        The search stops once tgt is settled (-1 searches the whole graph). Trees
+        are cached per source until the graph is next modified, and a cached tree
+        answers every target it already settled without running Dijkstra again.
+        """
+        key = (self._graph_version, src, weight)
+        tree = self._sssp_cache.get(key)
+        if tree is None or (tgt >= 0 and not tree[2][tgt]):
+            # A later target is settled after every node the cached tree had, so this replaces it
+            tree = self._sssp_cache[key] = dijkstra_csr(self.adj_indptr, self.adj_indices, 
+                                                        self._adj_weights(weight), src, tgt)
+        return tree[0], tree[1]
+    
+    def _adj_weights(self, weight):
+        """Weight of each adjacency entry, cached until the graph is next modified
+        
+        Edges missing the weight attribute count as 1, as in NetworkX.
+        """
+        key = (self._graph_version, weight)
+        if key not in self._adj_weight_cache:
+            adj = self.harness_graph._adj
+            edge_weight = np.array([adj[u][v].get(weight, 1) for u, v in self._edge_keys], dtype=np.float64)
+            self._adj_weight_cache[key] = edge_weight[self.adj_edge]
+        return self._adj_weight_cache[key]
+    
+    def estimate_installation_complexity(self, path=None, bundle_diameter=None):
         """Estimate installation complexity based on bundle diameter and path length
         
         Returns a score from 1-10 where higher means more complex
+        
+        Args:
+            path (list): Optional path of nodes; if None, scores the entire harness
+            bundle_diameter (float): Optional precomputed bundle diameter of the path
         """
         if not path:
             # For entire harness
-            total_length = self.calculate_total_length()
-            avg_diameter = np.mean(list(self.estimate_bundle_diameter().values()))
-            num_junctions = sum(1 for node, data in self.harness_graph.nodes(data=True) 
-                               if data.get("type") == "junction")
-            
-            # Simple complexity formula
-            complexity = (total_length * avg_diameter * 0.5) + (num_junctions * 1.5)
-            
-            # Scale to 1-10
-            return min(10, max(1, complexity))
+            return self._aggregate()["complexity"]
         else:
             # For specific path
-            path_length = sum(self.harness_graph[path[i]][path[i+1]]["length"] 
-                             for i in range(len(path)-1))
-            bundle_diameter = self.estimate_bundle_diameter(path)
+            adj = self.harness_graph._adj
+            path_length = sum(adj[u][v]["length"] for u, v in zip(path, path[1:]))
+            if bundle_diameter is None:
+                bundle_diameter = self.estimate_bundle_diameter(path)
             
             # Simple complexity formula for path
             complexity = path_length * bundle_diameter * 0.8
@@ -139,9 +378,33 @@ class HarnessAnalyzer:
             # Scale to 1-10
             return min(10, max(1, complexity))
     
+    def _aggregate(self):
+        """Harness-wide totals shared by the report and the complexity score,
+        cached until the graph is next modified"""
+        key = self._graph_version
+        if key not in self._aggregate_cache:
+            # Segments are sized on their own, so everything comes straight from the edge columns
+            self._aggregate_cache[key] = report_totals(
+                self.edge_length, segment_diameters(self.edge_gauge, self.edge_nsig), 
+                int(self._type_counts[NodeType.JUNCTION]))
+        return self._aggregate_cache[key]
+    
+    def _render_attributes(self):
+        """Per-node and per-edge drawing attributes, cached until the graph is next modified"""
+        key = self._graph_version
+        if key not in self._render_cache:
+            self._render_cache[key] = {
+                "node_colors": NODE_COLOR_LUT[self.node_type].tolist(),
+                "edge_colors": EDGE_COLOR_LUT[self.edge_wire_type].tolist(),
+            }
+        return self._render_cache[key]
+    
     def visualize_harness(self, ax=None, highlight_path=None):
         """Visualize the wire harness
         
+        The drawn artists are kept, so later calls on the same axes for an
+        unchanged graph only update the path highlight.
+        
         Args:
             ax (matplotlib.axes): Optional matplotlib axes to plot on
             highlight_path (list): Optional list of nodes to highlight
@@ -149,66 +412,130 @@ class HarnessAnalyzer:
         if ax is None:
             fig, ax = plt.subplots(figsize=(10, 8))
         
-        # Create node colors based on type
-        node_colors = []
-        for node in self.harness_graph.nodes():
-            node_type = self.harness_graph.nodes[node].get("type", "")
-            if node_type == "controller":
-                node_colors.append('red')
-            elif node_type == "sensor":
-                node_colors.append('green')
-            elif node_type == "actuator":
-                node_colors.append('blue')
-            elif node_type == "junction":
-                node_colors.append('orange')
-            else:
-                node_colors.append('gray')
-        
-        # Draw the network
-        nx.draw_networkx_nodes(self.harness_graph, self.node_positions, 
-                              node_color=node_colors, node_size=500, ax=ax)
-        
-        # Draw edges with colors based on wire type
-        edge_colors = []
-        for u, v, data in self.harness_graph.edges(data=True):
-            wire_type = data.get("wire_type", "")
-            if wire_type == "power":
-                edge_colors.append('red')
-            elif wire_type == "signal":
-                edge_colors.append('blue')
-            else:
-                edge_colors.append('black')
-        
-        nx.draw_networkx_edges(self.harness_graph, self.node_positions, 
-                              edge_color=edge_colors, width=2, ax=ax)
+        artists = self._artists
+        if (artists is not None and self._artists_version != self._graph_version 
+                and artists["highlight"].axes is ax):
+            # The graph changed since the last drawing on these axes
+            self.invalidate_visualization()
+        
+        artists = self._artists
+        if artists is None or artists["highlight"].axes is not ax:
+            self._build_artists(ax)
+        self._update_artists(highlight_path)
+        
+        return ax
+    
+    def invalidate_visualization(self):
+        """Take the kept harness artists off their axes, so the next
+        visualize_harness call draws the harness from scratch"""
+        if self._artists is not None:
+            ax = self._artists["highlight"].axes
+            for artist in self._artists.values():
+                if isinstance(artist, dict):
+                    parts = list(artist.values())
+                elif isinstance(artist, list):
+                    parts = artist
+                else:
+                    parts = [artist]
+                for part in parts:
+                    if part.axes is not None:
+                        part.remove()
+            
+            # Let the next drawing fit the view to the current layout again
+            if ax is not None:
+                ax.relim()
+                ax.set_autoscale_on(True)
+        
+        self._artists = None
+        self._artists_version = None
+        self.highlight_artist = None
+    
+    def _build_artists(self, ax):
+        """Draw the static harness on the axes and keep the created artists"""
+        # Node and edge colors based on type
+        render = self._render_attributes()
+        
+        # Draw the network straight from the position array; nodes sit above edges
+        pos = self.node_pos
+        nodes = ax.scatter(pos[:, 0], pos[:, 1], s=500, c=render["node_colors"], marker='o', zorder=2)
+        
+        segments = pos[np.stack([self.edge_src, self.edge_dst], axis=1)]
+        edges = LineCollection(segments, colors=render["edge_colors"], linewidths=2, 
+                               antialiaseds=(1,), zorder=1)
+        ax.add_collection(edges)
+        if len(segments):
+            # Pad the data limits around the wires by 5%, as NetworkX does
+            low, high = segments.reshape(-1, 2).min(axis=0), segments.reshape(-1, 2).max(axis=0)
+            pad = 0.05 * (high - low)
+            ax.update_datalim([low - pad, high + pad])
+            ax.autoscale_view()
         
         # Draw edge labels with gauge
-        edge_labels = {(u, v): f"{data.get('gauge', '')}AWG" 
-                      for u, v, data in self.harness_graph.edges(data=True)}
-        nx.draw_networkx_edge_labels(self.harness_graph, self.node_positions, 
-                                    edge_labels=edge_labels, ax=ax)
+        edge_labels = dict(zip(self._edge_keys, self._edge_gauge_labels))
+        edge_label_artists = self._draw_edge_labels(ax, edge_labels)
         
         # Draw node labels
-        nx.draw_networkx_labels(self.harness_graph, self.node_positions, font_weight='bold', ax=ax)
+        node_label_artists = nx.draw_networkx_labels(self.harness_graph, self.node_positions, 
+                                                     font_weight='bold', ax=ax)
         
-        # Highlight path if provided
-        if highlight_path and len(highlight_path) > 1:
-            path_edges = [(highlight_path[i], highlight_path[i+1]) for i in range(len(highlight_path)-1)]
-            nx.draw_networkx_edges(self.harness_graph, self.node_positions, 
-                                  edgelist=path_edges, edge_color='yellow', 
-                                  width=4, ax=ax)
+        # Path highlight, filled in by _update_artists
+        self.highlight_artist = LineCollection([], colors='yellow', linewidths=4, 
+                                               antialiaseds=(1,), zorder=1)
+        ax.add_collection(self.highlight_artist)
         
         ax.set_title("Wire Harness Layout")
         ax.set_axis_off()
+        self._pin_view_limits(ax)
         
-        return ax
+        self._artists = {
+            "nodes": nodes,
+            "edges": edges,
+            "edge_labels": edge_label_artists,
+            "node_labels": node_label_artists,
+            "highlight": self.highlight_artist,
+        }
+        self._artists_version = self._graph_version
+    
+    def _pin_view_limits(self, ax):
+        """Freeze the axes limits fitted to the node layout, so later redraws of
+        the reused artists skip the data limit recomputation"""
+        ax.set_xlim(ax.get_xlim())
+        ax.set_ylim(ax.get_ylim())
+        ax.set_autoscale_on(False)
+    
+    def _draw_edge_labels(self, ax, edge_labels):
+        """Draw each edge label at the middle of its wire, turned along the wire"""
+        start, end = self.node_pos[self.edge_src], self.node_pos[self.edge_dst]
+        middles = 0.5 * (start + end)
+        delta = end - start
+        angles = np.degrees(np.arctan2(delta[:, 1], delta[:, 0]))
+        
+        # Keep the text the right way up
+        angles[angles > 90] -= 180
+        angles[angles < -90] += 180
+        
+        # White rounded box behind each label
+        bbox = {"boxstyle": "round", "ec": (1.0, 1.0, 1.0), "fc": (1.0, 1.0, 1.0)}
+        return {edge: ax.text(x, y, edge_labels[edge], size=10, color='k', family='sans-serif', 
+                              horizontalalignment='center', verticalalignment='center', 
+                              rotation=angle, transform_rotates_text=True, 
+                              bbox=bbox, zorder=1, clip_on=True)
+                for edge, (x, y), angle in zip(self._edge_keys, middles.tolist(), angles.tolist())}
+    
+    def _update_artists(self, highlight_path=None):
+        """Point the path highlight at the given path, or clear it"""
+        segments = []
+        if highlight_path and len(highlight_path) > 1:
+            rows = [self._node_index[node] for node in highlight_path]
+            segments = self.node_pos[np.stack([rows[:-1], rows[1:]], axis=1)]
+        self.highlight_artist.set_segments(segments)
     
     def generate_report(self):
         """Generate a summary report of the harness analysis"""
-        total_length = self.calculate_total_length()
-        bundle_diameters = self.estimate_bundle_diameter()
-        avg_diameter = np.mean(list(bundle_diameters.values()))
-        max_diameter = max(bundle_diameters.values())
+        aggregate = self._aggregate()
+        total_length = aggregate["total_length"]
+        avg_diameter = aggregate["avg_diameter"]
+        max_diameter = aggregate["max_diameter"]
         installation_complexity = self.estimate_installation_complexity()
         
         # Calculate network properties
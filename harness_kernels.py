@@ -0,0 +1,245 @@
+import heapq
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    # Numba is optional; without it the kernels run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# Wire gauge to diameter lookup (AWG to mm), indexed by gauge number. The
+# first and last slots hold the 0.8 mm default, so clipping an unknown gauge
+# into range always lands on a default slot. Built once at import and frozen.
+GAUGE_DIAMETER_LUT = np.full(32, 0.8)
+GAUGE_DIAMETER_LUT[[16, 18, 20, 22, 24]] = [1.29, 1.02, 0.81, 0.64, 0.51]
+GAUGE_DIAMETER_LUT.flags.writeable = False
+
+
+def gauge_index(gauge):
+    """Row of a gauge in GAUGE_DIAMETER_LUT, or 0 (the 0.8 mm default) for gauges
+    that are not whole numbers within the table"""
+    try:
+        if gauge == int(gauge) and 0 <= gauge < len(GAUGE_DIAMETER_LUT):
+            return int(gauge)
+    except (TypeError, ValueError, OverflowError):
+        pass
+    return 0
+
+
+def wire_diameters(gauges):
+    """Look up wire diameters (mm) for an array of AWG gauges, defaulting to 0.8 mm"""
+    return GAUGE_DIAMETER_LUT[np.clip(gauges, 0, len(GAUGE_DIAMETER_LUT) - 1)]
+
+
+def segment_diameters(gauges, n_signals):
+    """Bundle diameters (mm) of segments carrying n_signals wires of the given gauges"""
+    # Circular packing: N wires of diameter d have area N*(d/2)^2*pi, i.e. diameter d*sqrt(N)
+    return wire_diameters(gauges) * np.sqrt(n_signals, dtype=np.float64)
+
+
+# Explicit signatures compile the kernels eagerly at import; with cache=True the
+# machine code is stored on disk, so later runs load it instead of compiling.
+# Run this module once (python harness_kernels.py) to fill the cache ahead of time.
+# The GUI runs path searches on a worker thread, so this kernel releases the GIL.
+@njit("(int64[:], int64[:], float64[:], int64, int64)", cache=True, nogil=True)
+def dijkstra_csr(indptr, indices, weights, source, target):
+    """Single-source Dijkstra over a CSR adjacency, stopping once target is settled
+
+    Pass a target of -1 to search the whole graph.
+
+    Returns:
+        tuple: (dist, prev, final) arrays indexed by node; prev is -1 for unreached
+               nodes and final marks the nodes whose dist and prev are final. Once
+               the search runs out of nodes, every node is final.
+    """
+    n = indptr.shape[0] - 1
+    dist = np.full(n, np.inf)
+    prev = np.full(n, -1, dtype=np.int64)
+    settled = np.zeros(n, dtype=np.bool_)
+
+    dist[source] = 0.0
+    heap = [(0.0, source)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if settled[u]:
+            continue
+        settled[u] = True
+        if u == target:
+            return dist, prev, settled
+
+        for k in range(indptr[u], indptr[u + 1]):
+            v = indices[k]
+            new_dist = d + weights[k]
+            if new_dist < dist[v]:
+                dist[v] = new_dist
+                prev[v] = u
+                heapq.heappush(heap, (new_dist, v))
+
+    # Nothing left to reach, so the unreached nodes are final as well
+    settled[:] = True
+    return dist, prev, settled
+
+
+@njit("(int64[:], int64[:], int64[:], int8[:], int16[:], boolean[:])", cache=True)
+def bundle_diameter_csr(indptr, indices, adj_edge, edge_gauge, edge_nsig, is_junction):
+    """Hierarchical bundle diameters over a CSR adjacency
+
+    A junction's downstream edges are the tree edges of a depth-first walk from
+    it. Junctions are processed in order of increasing downstream size, and each
+    incident edge outside that walk is widened to also carry the downstream wires.
+
+    Args:
+        indptr, indices (ndarray): CSR adjacency, neighbors in graph order
+        adj_edge (ndarray): Edge row index of each adjacency entry
+        edge_gauge, edge_nsig (ndarray): Per-edge AWG gauge and signal count
+        is_junction (ndarray): Per-node junction flag
+
+    Returns:
+        tuple: (seg_diams, space_util, util_order, n_util) where util_order[:n_util]
+               lists the edges given a space utilization, in the order first set
+    """
+    n_nodes = indptr.shape[0] - 1
+    n_edges = edge_gauge.shape[0]
+    # The frozen module-level LUT is compiled in as a constant
+    gauge_lut = GAUGE_DIAMETER_LUT
+    last_gauge = gauge_lut.shape[0] - 1
+
+    # Base diameters: N wires of diameter d bundle to d*sqrt(N)
+    seg = np.empty(n_edges)
+    for e in range(n_edges):
+        gauge = min(max(edge_gauge[e], 0), last_gauge)
+        seg[e] = gauge_lut[gauge] * math.sqrt(edge_nsig[e])
+
+    # A depth-first walk yields one tree edge per other node in the component,
+    # so downstream sizes come straight from component sizes
+    component = np.full(n_nodes, -1, dtype=np.int64)
+    component_size = np.zeros(n_nodes, dtype=np.int64)
+    stack = np.empty(n_nodes, dtype=np.int64)
+    for start in range(n_nodes):
+        if component[start] >= 0:
+            continue
+        component[start] = start
+        top = 0
+        stack[0] = start
+        while top >= 0:
+            node = stack[top]
+            top -= 1
+            component_size[start] += 1
+            for k in range(indptr[node], indptr[node + 1]):
+                neighbor = indices[k]
+                if component[neighbor] < 0:
+                    component[neighbor] = start
+                    top += 1
+                    stack[top] = neighbor
+
+    junctions = np.nonzero(is_junction)[0]
+    downstream_size = np.empty(junctions.shape[0], dtype=np.int64)
+    for i in range(junctions.shape[0]):
+        downstream_size[i] = component_size[component[junctions[i]]] - 1
+    order = np.argsort(downstream_size, kind='mergesort')
+
+    util = np.full(n_edges, np.nan)
+    util_order = np.empty(n_edges, dtype=np.int64)
+    n_util = 0
+
+    # Per-walk stamps avoid clearing the visited/downstream marks for every junction
+    visited = np.zeros(n_nodes, dtype=np.int64)
+    downstream = np.zeros(n_edges, dtype=np.int64)
+    next_entry = np.empty(n_nodes, dtype=np.int64)
+
+    for rank in range(order.shape[0]):
+        junction = junctions[order[rank]]
+        stamp = rank + 1
+
+        # Walk downstream, summing squared diameters (area without the pi/4 factor)
+        downstream_sum_sq = 0.0
+        visited[junction] = stamp
+        next_entry[junction] = indptr[junction]
+        top = 0
+        stack[0] = junction
+        while top >= 0:
+            node = stack[top]
+            k = next_entry[node]
+            if k == indptr[node + 1]:
+                top -= 1
+                continue
+            next_entry[node] = k + 1
+            neighbor = indices[k]
+            if visited[neighbor] != stamp:
+                visited[neighbor] = stamp
+                e = adj_edge[k]
+                downstream[e] = stamp
+                downstream_sum_sq += seg[e] * seg[e]
+                next_entry[neighbor] = indptr[neighbor]
+                top += 1
+                stack[top] = neighbor
+
+        # Widen the incident edges that are not part of the downstream walk
+        for k in range(indptr[junction], indptr[junction + 1]):
+            e = adj_edge[k]
+            if downstream[e] == stamp:
+                continue
+            base_sq = seg[e] * seg[e]
+            total_sq = base_sq + downstream_sum_sq
+            if total_sq > 0:
+                seg[e] = math.sqrt(total_sq)
+                if np.isnan(util[e]):
+                    util_order[n_util] = e
+                    n_util += 1
+                util[e] = (base_sq / total_sq) * 100
+
+    return seg, util, util_order, n_util
+
+
+@njit("(float64, float64[:], int64)", cache=True)
+def installation_complexity(total_length, diameters, n_junctions):
+    """Whole-harness installation complexity score, clamped to 1-10
+
+    Args:
+        total_length (float): Total wire length of the harness
+        diameters (ndarray): Segment bundle diameters
+        n_junctions (int): Number of junctions
+    """
+    avg_diameter = diameters.mean() if diameters.shape[0] > 0 else 0.0
+
+    # Simple complexity formula
+    complexity = (total_length * avg_diameter * 0.5) + (n_junctions * 1.5)
+    return min(10.0, max(1.0, complexity))
+
+
+def report_totals(lengths, diameters, n_junctions):
+    """Harness-wide report figures from the edge columns, with no Python-level loop
+
+    Args:
+        lengths (ndarray): Segment lengths
+        diameters (ndarray): Segment bundle diameters
+        n_junctions (int): Number of junctions
+
+    Returns:
+        dict: total_length, diameters, avg_diameter, max_diameter, num_junctions
+              and the whole-harness complexity score
+    """
+    total_length = float(lengths.sum())
+    has_segments = len(diameters) > 0
+    return {
+        "total_length": total_length,
+        "diameters": diameters,
+        "avg_diameter": float(diameters.mean()) if has_segments else 0,
+        "max_diameter": float(diameters.max()) if has_segments else 0,
+        "num_junctions": n_junctions,
+        "complexity": float(installation_complexity(total_length, diameters, n_junctions)),
+    }
+
+
+if __name__ == "__main__":
+    for kernel in (dijkstra_csr, bundle_diameter_csr, installation_complexity):
+        print(f"{kernel.__name__}: {'compiled' if NUMBA_AVAILABLE else 'numba not installed'}")